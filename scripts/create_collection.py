@@ -1,4 +1,9 @@
+import argparse
+import asyncio
+import json
 import os
+from typing import Any, List, Optional
+
 from dotenv import load_dotenv
 from hypha_rpc import connect_to_server
 
@@ -6,52 +11,173 @@ from hypha_rpc import connect_to_server
 load_dotenv()
 
 SERVER_URL = os.getenv("SERVER_URL", "https://hypha.aicell.io")
+DEFAULT_WORKSPACE = "chiron-platform"
 
-async def create_collection():
-    server = await connect_to_server({
-        "server_url": SERVER_URL,
-        "workspace": "chiron-platform",
-        "token": os.environ.get("WORKSPACE_TOKEN")
-    })
-    artifact_manager = await server.get_service("public/artifact-manager")
+SPEC_KEYS = {"alias", "manifest", "config"}
+REQUIRED_SPEC_KEYS = {"alias", "manifest"}
 
-    collection = await artifact_manager.create(
-        alias="chiron-platform/collection",
-        type="collection",
-        manifest={
-            "name": "Chiron Platform Data Collection",
-            "description": "A collection of data for the Chiron Platform project",
-            "version": "0.1.0",
-            "authors": [],
-            "tags": ["chiron-platform", "single-cell", "federated-learning"],
-            "license": "MIT",
-            "documentation": "",
-            "covers": [],
-            "badges": [],
-            "links": []
+
+def default_collections(workspace: str) -> List[dict]:
+    """Collections created when no --manifest-file is given."""
+    return [
+        {
+            "alias": f"{workspace}/collection",
+            "manifest": {
+                "name": "Chiron Platform Data Collection",
+                "description": "A collection of data for the Chiron Platform project",
+                "version": "0.1.0",
+                "authors": [],
+                "tags": ["chiron-platform", "single-cell", "federated-learning"],
+                "license": "MIT",
+                "documentation": "",
+                "covers": [],
+                "badges": [],
+                "links": []
+            },
+            "config": {
+                "permissions": {"*": "r", "@": "r+"},
+            },
         },
-        config={
-            "permissions": {"*": "r", "@": "r+"},
+        {
+            "alias": f"{workspace}/ray-deployments",
+            "manifest": {
+                "name": "Chiron Platform Ray Deployments Collection",
+                "description": "A collection of Ray deployments for the Chiron Platform project",
+            },
+            "config": {
+                "permissions": {"*": "r", "@": "r+"},
+            },
         },
-        overwrite=True
-    )
-    print(f"Collection created: {collection}")
+    ]
+
+
+# Shared Hypha connection, opened once and reused by every operation
+_client = None
+_artifact_mgr = None
+_workspace: Optional[str] = None
+_init_lock = asyncio.Lock()
+
+
+async def get_artifact_manager(workspace: str = DEFAULT_WORKSPACE) -> Any:
+    """Return the cached artifact manager, connecting on first use.
+
+    Only one workspace connection is cached; asking for a different
+    workspace while connected raises ``ValueError``.
+    """
+    global _client, _artifact_mgr, _workspace
+    async with _init_lock:
+        if _artifact_mgr is not None and workspace != _workspace:
+            raise ValueError(
+                f"Already connected to workspace {_workspace!r}, cannot reuse it for {workspace!r}"
+            )
+        if _artifact_mgr is None:
+            try:
+                _client = await connect_to_server({
+                    "server_url": SERVER_URL,
+                    "workspace": workspace,
+                    "token": os.environ.get("WORKSPACE_TOKEN")
+                })
+                _artifact_mgr = await _client.get_service("public/artifact-manager")
+                _workspace = workspace
+            except Exception as e:
+                raise RuntimeError(f"Failed to connect to {SERVER_URL}: {e}") from e
+    return _artifact_mgr
+
+
+async def close() -> None:
+    """Disconnect the shared Hypha connection, if one was opened."""
+    global _client, _artifact_mgr, _workspace
+    if _client is not None:
+        await _client.disconnect()
+    _client = None
+    _artifact_mgr = None
+    _workspace = None
 
-    # Create a deployment collection
-    deployment_collection = await artifact_manager.create(
-        alias="chiron-platform/ray-deployments",
+
+async def create_one(mgr: Any, alias: str, manifest: dict, config: Optional[dict] = None) -> Any:
+    """Create (or overwrite) a single collection artifact."""
+    return await mgr.create(
+        alias=alias,
         type="collection",
-        manifest={
-            "name": "Chiron Platform Ray Deployments Collection",
-            "description": "A collection of Ray deployments for the Chiron Platform project",
-        },
-        config={
-            "permissions": {"*": "r", "@": "r+"},
-        },
+        manifest=manifest,
+        config=config,
         overwrite=True
     )
-    print(f"Deployment collection created: {deployment_collection}")
+
+
+def validate_specs(specs: Any, source: str) -> List[dict]:
+    """Check that specs is a list of {alias, manifest[, config]} dicts."""
+    if not isinstance(specs, list):
+        raise SystemExit(f"{source}: expected a JSON list of collection specs, got {type(specs).__name__}")
+    for i, spec in enumerate(specs):
+        if not isinstance(spec, dict):
+            raise SystemExit(f"{source}: spec #{i} must be an object, got {type(spec).__name__}")
+        unknown = set(spec) - SPEC_KEYS
+        if unknown:
+            raise SystemExit(f"{source}: spec #{i} has unknown key(s): {', '.join(sorted(unknown))}")
+        missing = REQUIRED_SPEC_KEYS - set(spec)
+        if missing:
+            raise SystemExit(f"{source}: spec #{i} is missing key(s): {', '.join(sorted(missing))}")
+        if not isinstance(spec["alias"], str) or not spec["alias"]:
+            raise SystemExit(f"{source}: spec #{i} 'alias' must be a non-empty string")
+        if not isinstance(spec["manifest"], dict):
+            raise SystemExit(f"{source}: spec #{i} 'manifest' must be an object")
+        if spec.get("config") is not None and not isinstance(spec["config"], dict):
+            raise SystemExit(f"{source}: spec #{i} 'config' must be an object")
+    return specs
+
+
+def load_specs(
+    workspace: str,
+    manifest_file: Optional[str] = None,
+    aliases: Optional[List[str]] = None,
+) -> List[dict]:
+    """Load collection specs from a JSON list file, optionally filtered by alias."""
+    if manifest_file:
+        try:
+            with open(manifest_file, "r") as f:
+                specs = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise SystemExit(f"Cannot read collection specs from {manifest_file}: {e}")
+        specs = validate_specs(specs, manifest_file)
+    else:
+        specs = default_collections(workspace)
+    if aliases:
+        specs = [spec for spec in specs if spec["alias"] in aliases]
+        missing = set(aliases) - {spec["alias"] for spec in specs}
+        if missing:
+            raise SystemExit(f"Unknown collection alias(es): {', '.join(sorted(missing))}")
+    return specs
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Create Chiron Platform collections")
+    parser.add_argument("--workspace", default=DEFAULT_WORKSPACE,
+                        help="Hypha workspace to connect to (also prefixes the default aliases)")
+    parser.add_argument("--alias", action="append",
+                        help="Only create the collection with this alias (repeatable)")
+    parser.add_argument("--manifest-file",
+                        help="JSON file with a list of {alias, manifest, config} specs")
+    args = parser.parse_args()
+
+    specs = load_specs(args.workspace, args.manifest_file, args.alias)
+    try:
+        mgr = await get_artifact_manager(args.workspace)
+        results = await asyncio.gather(
+            *[create_one(mgr, **spec) for spec in specs], return_exceptions=True
+        )
+        failed = 0
+        for spec, result in zip(specs, results):
+            if isinstance(result, BaseException):
+                failed += 1
+                print(f"Failed to create collection {spec['alias']}: {result}")
+            else:
+                print(f"Collection created: {spec['alias']} -> {result}")
+        if failed:
+            raise SystemExit(f"{failed} of {len(specs)} collection(s) failed")
+    finally:
+        await close()
+
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(create_collection()) 
\ No newline at end of file
+    asyncio.run(main())
@@ -154,15 +154,36 @@ class HTTPCallError(RuntimeError):
     pass
 
 
+# One pooled client for the whole run. The status loops below poll every few
+# seconds, so a per-call client would redo the TCP + TLS handshake each time.
+_HTTP: Optional[httpx.AsyncClient] = None
+
+
+def http_client() -> httpx.AsyncClient:
+    global _HTTP
+    if _HTTP is None:
+        _HTTP = httpx.AsyncClient(
+            timeout=300,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+    return _HTTP
+
+
+async def close_http_client() -> None:
+    global _HTTP
+    if _HTTP is not None:
+        await _HTTP.aclose()
+        _HTTP = None
+
+
 async def hypha_post(service_id: str, method: str, kwargs: Optional[dict] = None, timeout_s: float = 300) -> Any:
     ws, rest = service_id.split("/", 1)
     url = f"{HYPHA_BASE}/{ws}/services/{rest}/{method}"
     headers = {"Authorization": f"Bearer {TOKEN}", "Content-Type": "application/json"}
-    async with httpx.AsyncClient(timeout=timeout_s) as c:
-        r = await c.post(url, headers=headers, content=json.dumps(kwargs or {}).encode())
-        if r.status_code >= 400:
-            raise HTTPCallError(f"HTTP {r.status_code} {service_id}.{method}: {r.text[:400]}")
-        return json.loads(r.text) if r.text else None
+    r = await http_client().post(url, headers=headers, content=json.dumps(kwargs or {}).encode(), timeout=timeout_s)
+    if r.status_code >= 400:
+        raise HTTPCallError(f"HTTP {r.status_code} {service_id}.{method}: {r.text[:400]}")
+    return json.loads(r.text) if r.text else None
 
 
 # ---------------------------------------------------------------------------
@@ -366,11 +387,10 @@ async def watch_training(
 async def list_artifact_files(artifact_id: str) -> List[str]:
     workspace, alias = artifact_id.split("/", 1)
     url = f"{HYPHA_BASE}/{workspace}/artifacts/{alias}/files/"
-    async with httpx.AsyncClient(timeout=15) as c:
-        r = await c.get(url, headers={"Authorization": f"Bearer {TOKEN}"})
-        if r.status_code != 200:
-            return []
-        return [f.get("name") for f in (r.json() or []) if isinstance(f, dict)]
+    r = await http_client().get(url, headers={"Authorization": f"Bearer {TOKEN}"}, timeout=15)
+    if r.status_code != 200:
+        return []
+    return [f.get("name") for f in (r.json() or []) if isinstance(f, dict)]
 
 
 async def verify_published(am, artifact_id: str, *, expect_global_transformer: bool, label: str) -> bool:
@@ -629,7 +649,10 @@ async def main():
             await remove_app(server, site, app_id, "trainer", user_id)
         if orch_app_id:
             await remove_app(server, orch_site, orch_app_id, "orchestrator", user_id)
-        await server.disconnect()
+        try:
+            await server.disconnect()
+        finally:
+            await close_http_client()
 
     log("")
     log("=" * 78)